@@ -6,5 +6,6 @@ CSV_FILE = "marketing_campaigns.csv"
 EXCEL_FILE = "sales_targets.xlsx"
 TENANTS = ['tenant_001', 'tenant_002', 'tenant_003']
 REGIONS = ['North', 'South', 'East', 'West']
+RANDOM_SEED = None
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -7,8 +7,8 @@ SELECT
     impressions,
     clicks,
     conversions,
-    spend,
-    revenue,
+    ROUND(spend, 2) as spend,
+    ROUND(revenue, 2) as revenue,
     ctr,
     roi,
     CASE 
@@ -38,9 +38,9 @@ SELECT
     date,
     tenant_id,
     SUM(conversions) as daily_conversions,
-    SUM(revenue) as daily_revenue,
-    SUM(spend) as daily_spend,
-    SUM(revenue) - SUM(spend) as daily_profit
+    ROUND(SUM(revenue), 2) as daily_revenue,
+    ROUND(SUM(spend), 2) as daily_spend,
+    ROUND(SUM(revenue) - SUM(spend), 2) as daily_profit
 FROM fact_campaigns 
 WHERE tenant_id = 'tenant_001'  -- Replace with parameter
   AND date >= date('now', '-30 days')
@@ -5,7 +5,6 @@ Perfect for showcasing to recruiters and on LinkedIn
 """
 
 import sqlite3
-import pandas as pd
 from datetime import datetime
 
 def showcase_project():
@@ -32,53 +31,52 @@ def showcase_project():
     
     print("📈 DATA PROCESSING METRICS:")
     
-    # Campaign data
-    campaigns_df = pd.read_sql_query("SELECT COUNT(*) as count FROM fact_campaigns", conn)
-    print(f"✅ Marketing Campaigns: {campaigns_df['count'].iloc[0]:,} records")
-    
-    # Targets data
-    targets_df = pd.read_sql_query("SELECT COUNT(*) as count FROM dim_sales_targets", conn)
-    print(f"✅ Sales Targets: {targets_df['count'].iloc[0]:,} records")
-    
-    # Customers data
-    customers_df = pd.read_sql_query("SELECT COUNT(*) as count FROM dim_customers", conn)
-    print(f"✅ Customer Records: {customers_df['count'].iloc[0]:,} records")
+    # Record counts for all tables in a single round-trip
+    campaigns_count, targets_count, customers_count = conn.execute("""
+        SELECT 
+            (SELECT COUNT(*) FROM fact_campaigns),
+            (SELECT COUNT(*) FROM dim_sales_targets),
+            (SELECT COUNT(*) FROM dim_customers)
+    """).fetchone()
+    print(f"✅ Marketing Campaigns: {campaigns_count:,} records")
+    print(f"✅ Sales Targets: {targets_count:,} records")
+    print(f"✅ Customer Records: {customers_count:,} records")
     
     print()
     print("🏢 MULTI-TENANT ARCHITECTURE:")
     
     # Tenant summary
-    tenant_summary = pd.read_sql_query("""
+    tenant_summary = conn.execute("""
         SELECT 
             tenant_id,
             COUNT(*) as campaigns,
             ROUND(SUM(revenue), 2) as total_revenue,
-            ROUND(AVG(roi), 2) as avg_roi
+            ROUND(1.0 * (SUM(revenue) - SUM(spend)) / NULLIF(SUM(spend), 0), 2) as avg_roi
         FROM fact_campaigns 
         GROUP BY tenant_id
         ORDER BY tenant_id
-    """, conn)
+    """).fetchall()
     
-    for _, row in tenant_summary.iterrows():
-        print(f"   {row['tenant_id']}: {row['campaigns']} campaigns, ${row['total_revenue']:,.2f} revenue, {row['avg_roi']} ROI")
+    for tenant_id, campaigns, total_revenue, avg_roi in tenant_summary:
+        print(f"   {tenant_id}: {campaigns} campaigns, ${total_revenue:,.2f} revenue, {avg_roi} ROI")
     
     print()
     print("📊 SAMPLE ANALYTICS:")
     
     # Performance metrics
-    metrics = pd.read_sql_query("""
+    avg_ctr, avg_roi, total_revenue, total_spend = conn.execute("""
         SELECT 
-            ROUND(AVG(ctr), 4) as avg_ctr,
-            ROUND(AVG(roi), 2) as avg_roi,
+            ROUND(1.0 * SUM(clicks) / NULLIF(SUM(impressions), 0), 4) as avg_ctr,
+            ROUND(1.0 * (SUM(revenue) - SUM(spend)) / NULLIF(SUM(spend), 0), 2) as avg_roi,
             ROUND(SUM(revenue), 2) as total_revenue,
             ROUND(SUM(spend), 2) as total_spend
         FROM fact_campaigns
-    """, conn)
+    """).fetchone()
     
-    print(f"   Average CTR: {metrics['avg_ctr'].iloc[0]:.2%}")
-    print(f"   Average ROI: {metrics['avg_roi'].iloc[0]:.2f}")
-    print(f"   Total Revenue: ${metrics['total_revenue'].iloc[0]:,.2f}")
-    print(f"   Total Spend: ${metrics['total_spend'].iloc[0]:,.2f}")
+    print(f"   Average CTR: {avg_ctr:.2%}")
+    print(f"   Average ROI: {avg_roi:.2f}")
+    print(f"   Total Revenue: ${total_revenue:,.2f}")
+    print(f"   Total Spend: ${total_spend:,.2f}")
     
     print()
     print("🎯 BUSINESS IMPACT:")